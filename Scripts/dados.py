@@ -1,19 +1,52 @@
+import io
+import os
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+import requests
+import requests_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
 from decimal import Decimal
 
+# Cache HTTP persistente: as páginas já baixadas são lidas do disco
+# nas execuções seguintes
+requests_cache.install_cache(
+    'vitibrasil_cache',
+    backend='sqlite',
+    expire_after=timedelta(days=30)
+)
+
+# Tempo máximo de espera (segundos) por resposta em cada download
+TIMEOUT_DOWNLOAD = 30
+
+# Validade do cache para o ano corrente, cujos dados ainda podem mudar
+EXPIRACAO_ANO_CORRENTE = timedelta(days=1)
+
+# Níveis de volume exportado, do menor para o maior
+TIPO_VOLUME = pd.CategoricalDtype(
+    ['Sem Volume', 'Muito Baixo', 'Baixo', 'Médio', 'Alto'],
+    ordered=True
+)
+
+# Opções de escrita dos arquivos Parquet
+PARQUET_OPCOES = {'engine': 'pyarrow', 'compression': 'zstd', 'index': False}
+
 class PipelineDadosVinho:
     """Pipeline para processamento de dados de exportação de vinho do Brasil"""
     
-    def __init__(self, densidade_vm: float = 0.995):
+    def __init__(self, densidade_vm: float = 0.995, max_workers: int = 8, debug: bool = False):
         """
         Inicializa a pipeline
         
         Args:
             densidade_vm: Densidade do vinho para conversão kg → litros
+            max_workers: Número de downloads simultâneos na pipeline
+            debug: Exibe o uso de memória dos dados processados
         """
         self.densidade_vm = densidade_vm
+        self.max_workers = max_workers
+        self.debug = debug
         self.vitibrasil_url = 'http://vitibrasil.cnpuv.embrapa.br/'
         self.cambio_url = 'https://www.dineroeneltiempo.com/divisas/usd-brl/historico?utm_source=chatgpt.com'
         self.continentes_url = "https://paintmaps.com/pt/informacoes-do-pais/continente"
@@ -30,11 +63,35 @@ class PipelineDadosVinho:
             'Coreia, Republica Sul': 'Coréia do Sul',
             'Taiwan (Formosa)': 'Taiwan'
         }
+        self._mapa_paises = pd.Series(self.replacement_dict)
         
         # Cache para dados baixados
         self._dados_cambio = None
         self._dados_continentes = None
+        self._dados_exportacao: Dict[int, pd.DataFrame] = {}
+        
+        # Tabelas de consulta derivadas dos dados auxiliares
+        self._cambio_por_ano = None
+        self._continente_map = None
         
+    def _baixar_html(self, url: str, **kwargs) -> io.StringIO:
+        """
+        Baixa o HTML de uma página passando pelo cache HTTP
+        
+        Args:
+            url: Endereço da página
+            **kwargs: Argumentos repassados ao requests (ex.: expire_after)
+            
+        Returns:
+            Buffer com o HTML, pronto para o pd.read_html
+        """
+        # Sem timeout, uma conexão travada bloquearia a pipeline paralela
+        kwargs.setdefault('timeout', TIMEOUT_DOWNLOAD)
+        resposta = requests.get(url, **kwargs)
+        resposta.raise_for_status()
+        resposta.encoding = 'UTF-8'
+        return io.StringIO(resposta.text)
+    
     def baixar_dados_cambio(self) -> pd.DataFrame:
         """Baixa e processa dados históricos de câmbio USD/BRL"""
         if self._dados_cambio is not None:
@@ -49,10 +106,7 @@ class PipelineDadosVinho:
             'Máximo': 'Maximo'
         }
         
-        cambio_df = pd.read_html(
-            self.cambio_url, 
-            encoding='UTF-8'
-        )[0]
+        cambio_df = pd.read_html(self._baixar_html(self.cambio_url))[0]
         
         cambio_df.rename(columns=replacement_labels, inplace=True)
         
@@ -65,6 +119,7 @@ class PipelineDadosVinho:
             ).round(2)
         
         self._dados_cambio = cambio_df
+        self._cambio_por_ano = cambio_df.set_index('Ano')
         return cambio_df.copy()
     
     def baixar_dados_continentes(self) -> pd.DataFrame:
@@ -72,10 +127,7 @@ class PipelineDadosVinho:
         if self._dados_continentes is not None:
             return self._dados_continentes.copy()
         
-        continentes_df = pd.read_html(
-            self.continentes_url, 
-            encoding="UTF-8"
-        )[0]
+        continentes_df = pd.read_html(self._baixar_html(self.continentes_url))[0]
         
         # Mapeamento especial para alguns países
         mapa_continente_especial = {
@@ -91,6 +143,9 @@ class PipelineDadosVinho:
         )
         
         self._dados_continentes = continentes_df
+        self._continente_map = dict(
+            zip(continentes_df['PAÍS'], continentes_df['CONTINENTE'])
+        )
         return continentes_df.copy()
     
     def baixar_dados_exportacao_ano(self, ano: int) -> pd.DataFrame:
@@ -103,8 +158,29 @@ class PipelineDadosVinho:
         Returns:
             DataFrame com dados de exportação do ano
         """
+        if ano not in self._dados_exportacao:
+            self._dados_exportacao[ano] = self._carregar_dados_exportacao_ano(ano)
+        
+        return self._dados_exportacao[ano].copy()
+    
+    def _carregar_dados_exportacao_ano(self, ano: int) -> pd.DataFrame:
+        """Lê os dados brutos do ano do disco ou, se ausentes, do site"""
+        # Anos anteriores ao corrente não mudam mais e ficam salvos em disco
+        ano_finalizado = ano < date.today().year
+        caminho_cache = f'Data/cache/Embrapa_vitibrasil_bruto_{ano}.parquet'
+        
+        if ano_finalizado and os.path.exists(caminho_cache):
+            return pd.read_parquet(caminho_cache)
+        
         url = f'{self.vitibrasil_url}/index.php?ano={ano}&opcao=opt_06&subopcao=subopt_01'
-        df = pd.read_html(url, encoding='UTF-8')[3]
+        
+        # Cache HTTP sem expiração para anos finalizados
+        if ano_finalizado:
+            expiracao = requests_cache.NEVER_EXPIRE
+        else:
+            expiracao = EXPIRACAO_ANO_CORRENTE
+        
+        df = pd.read_html(self._baixar_html(url, expire_after=expiracao))[3]
         
         # Remover linhas com NaN e total
         df.dropna(inplace=True)
@@ -113,160 +189,247 @@ class PipelineDadosVinho:
         # Adicionar coluna de ano
         df['Ano'] = ano
         
+        if ano_finalizado:
+            os.makedirs(os.path.dirname(caminho_cache), exist_ok=True)
+            df.to_parquet(caminho_cache, **PARQUET_OPCOES)
+        
         return df
     
     def processar_dados_exportacao(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Processa e enriquece os dados de exportação
         
+        Aceita um ou mais anos no mesmo DataFrame; market share e
+        categorização de volume são calculados dentro de cada ano
+        
         Args:
             df: DataFrame com dados brutos de exportação
             
         Returns:
-            DataFrame processado e enriquecido
+            DataFrame processado e enriquecido (o próprio df, alterado)
         """
-        df_processado = df.copy()
-        
-        # Baixar dados auxiliares
-        cambio_df = self.baixar_dados_cambio()
-        continentes_df = self.baixar_dados_continentes()
-        
-        # Merge com dados de câmbio
-        df_processado = pd.merge(
-            df_processado, 
-            cambio_df, 
-            on='Ano', 
-            how='left'
-        )
+        # Baixar dados auxiliares (preenche as tabelas de consulta)
+        self.baixar_dados_cambio()
+        self.baixar_dados_continentes()
+        
+        # Adicionar dados de câmbio do ano
+        for coluna in self._cambio_por_ano.columns:
+            df[coluna] = df['Ano'].map(self._cambio_por_ano[coluna])
         
         # Tratamento de valores
-        df_processado = self._tratar_valores(df_processado)
+        df_processado = self._tratar_valores(df)
         
         # Criar novas variáveis
         df_processado = self._criar_variaveis(df_processado)
         
         # Adicionar informações de continente
-        df_processado = pd.merge(
-            df_processado,
-            continentes_df,
-            left_on='Países',
-            right_on='PAÍS',
-            how='left'
+        df_processado['CONTINENTE'] = (
+            df_processado['Países'].map(self._continente_map).astype('category')
         )
         
-        # Calcular market share
-        total_valor_usd = df_processado['Valor (US$)'].sum()
+        # Calcular market share dentro de cada ano (acumulando em float64)
+        valor_usd = df_processado['Valor (US$)'].astype(np.float64)
+        total_valor_usd = valor_usd.groupby(df_processado['Ano']).transform('sum')
         df_processado['Market_Share'] = (
-            (df_processado['Valor (US$)'] / total_valor_usd * 100)
+            (valor_usd / total_valor_usd * 100)
             .round(2)
         )
         
-        # Categorizar volume
-        df_processado['Quantidade_Volume'] = self._categorizar_volume(
-            df_processado['Quantidade (L)']
+        # Categorizar volume dentro de cada ano
+        codigos_volume = np.zeros(len(df_processado), dtype=np.int8)
+        volumes = df_processado['Quantidade (L)']
+        for linhas in df_processado.groupby('Ano').indices.values():
+            codigos_volume[linhas] = (
+                self._categorizar_volume(volumes.iloc[linhas]).cat.codes.to_numpy()
+            )
+        df_processado['Quantidade_Volume'] = pd.Categorical.from_codes(
+            codigos_volume, dtype=TIPO_VOLUME
         )
         
-        # Remover coluna auxiliar
-        if 'PAÍS' in df_processado.columns:
-            df_processado.drop('PAÍS', axis=1, inplace=True)
+        if self.debug:
+            print("Uso de memória (bytes) por coluna:")
+            print(df_processado.memory_usage(deep=True))
         
         return df_processado
     
     def _tratar_valores(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Trata valores das colunas Quantidade e Valor"""
-        df_tratado = df.copy()
-        
-        # Tratar Quantidade (Kg)
-        df_tratado['Quantidade (Kg)'] = (
-            df_tratado['Quantidade (Kg)']
-            .astype(str)
-            .str.strip()
-            .replace('-', '0')
-            .str.replace('.', '', regex=False)
+        """Trata valores das colunas Quantidade e Valor (altera o próprio df)"""
+        # Tratar Quantidade (Kg) e Valor (US$)
+        # O downcast só reduz o tipo (ex.: int32, float32) sem perda de valores;
+        # inteiro com sinal para que diferenças entre anos não deem overflow
+        df['Quantidade (Kg)'] = pd.to_numeric(
+            self._converter_numerico(df['Quantidade (Kg)']).fillna(0).astype('int64'),
+            downcast='integer'
         )
         
-        df_tratado['Quantidade (Kg)'] = pd.to_numeric(
-            df_tratado['Quantidade (Kg)'],
-            errors='coerce'
-        ).astype('Int64')
-        
-        # Tratar Valor (US$)
-        df_tratado['Valor (US$)'] = (
-            df_tratado['Valor (US$)']
-            .astype(str)
-            .str.strip()
-            .replace('-', '0')
-            .str.replace('.', '', regex=False)
+        df['Valor (US$)'] = pd.to_numeric(
+            self._converter_numerico(df['Valor (US$)']).fillna(0).astype('float64'),
+            downcast='float'
         )
         
-        df_tratado['Valor (US$)'] = pd.to_numeric(
-            df_tratado['Valor (US$)'],
+        # Corrigir nomes de países
+        df['Países'] = self._corrigir_paises(df['Países'])
+        
+        return df
+    
+    def _converter_numerico(self, serie: pd.Series) -> pd.Series:
+        """Converte valores do site ('1.234', '-') em números"""
+        return pd.to_numeric(
+            serie
+            .astype('string')
+            .str.replace('.', '', regex=False)
+            .replace({'-': '0', '': '0'}),
             errors='coerce'
-        ).astype('Float64')
+        )
+    
+    def _corrigir_paises(self, serie_paises: pd.Series) -> pd.Series:
+        """
+        Corrige nomes de países aplicando o dicionário apenas às categorias
         
-        # Corrigir nomes de países
-        df_tratado['Países'] = df_tratado['Países'].replace(self.replacement_dict)
+        Args:
+            serie_paises: Série com nomes de países
+            
+        Returns:
+            Série categórica com nomes corrigidos
+        """
+        paises = serie_paises.astype('category')
+        categorias = paises.cat.categories
+        
+        a_corrigir = categorias.isin(self._mapa_paises.index)
+        if not a_corrigir.any():
+            return paises
+        
+        # Nomes corrigidos podem coincidir (ex.: as duas grafias de Taiwan),
+        # por isso as categorias são refatoradas em vez de renomeadas
+        nomes_corrigidos = categorias.where(
+            ~a_corrigir,
+            categorias.map(self._mapa_paises)
+        )
+        codigos_corrigidos, categorias_corrigidas = pd.factorize(nomes_corrigidos)
+        
+        codigos = paises.cat.codes.to_numpy()
+        codigos = np.where(codigos >= 0, codigos_corrigidos[codigos], -1)
         
-        return df_tratado
+        return pd.Series(
+            pd.Categorical.from_codes(codigos, categories=categorias_corrigidas),
+            index=serie_paises.index,
+            name=serie_paises.name
+        )
     
     def _criar_variaveis(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Cria novas variáveis derivadas"""
-        df_enriquecido = df.copy()
-        
-        # Quantidade em litros
-        df_enriquecido['Quantidade (L)'] = (
-            df_enriquecido['Quantidade (Kg)'] / self.densidade_vm
-        ).round(2)
-        
-        # Valor em Reais
-        df_enriquecido['Valor (R$)'] = (
-            df_enriquecido['Valor (US$)'] * df_enriquecido['Cambio']
-        ).round(2)
-        
-        # Valor por litro em US$
-        df_enriquecido['Valor (L) US$'] = (
-            df_enriquecido['Valor (US$)'] / df_enriquecido['Quantidade (L)']
-        ).where(df_enriquecido['Quantidade (L)'] > 0, 0).round(2)
-        
-        # Valor por litro em R$
-        df_enriquecido['Valor (L) R$'] = (
-            df_enriquecido['Valor (R$)'] / df_enriquecido['Quantidade (L)']
-        ).where(df_enriquecido['Quantidade (L)'] > 0, 0).round(2)
-        
-        return df_enriquecido
+        """Cria novas variáveis derivadas (altera o próprio df)"""
+        kg = df['Quantidade (Kg)'].to_numpy(dtype=np.float64)
+        usd = df['Valor (US$)'].to_numpy(dtype=np.float64)
+        cambio = df['Cambio'].to_numpy(dtype=np.float64)
+        
+        # Quantidade em litros e valor em Reais
+        litros = np.round(kg / self.densidade_vm, 2)
+        brl = np.round(usd * cambio, 2)
+        
+        # Valores por litro (0 quando não há volume exportado), em float32:
+        # são valores pequenos, e os totais acima ficam em float64
+        com_volume = litros > 0
+        litros_32 = litros.astype(np.float32)
+        usd_litro = np.round(
+            np.divide(
+                usd.astype(np.float32), litros_32,
+                out=np.zeros_like(litros_32), where=com_volume
+            ), 2
+        )
+        brl_litro = np.round(
+            np.divide(
+                brl.astype(np.float32), litros_32,
+                out=np.zeros_like(litros_32), where=com_volume
+            ), 2
+        )
+        
+        df['Quantidade (L)'] = litros
+        df['Valor (R$)'] = brl
+        df['Valor (L) US$'] = usd_litro
+        df['Valor (L) R$'] = brl_litro
+        
+        return df
     
     def _categorizar_volume(self, serie_volume: pd.Series) -> pd.Series:
-        """Categoriza volumes em níveis"""
-        volume_categorizado = pd.Series(
-            'Sem Volume', 
-            index=serie_volume.index
-        )
+        """Categoriza volumes em níveis (série categórica ordenada)"""
+        volumes = serie_volume.to_numpy(dtype=np.float64)
+        
+        # Código 0 = 'Sem Volume'; volumes positivos recebem 1 a 4
+        codigos = np.zeros(len(volumes), dtype=np.int8)
         
         # Apenas categorizar volumes maiores que 0
-        mask = serie_volume > 0
+        mask = volumes > 0
         
         if mask.any():
-            volumes_positivos = serie_volume[mask]
+            volumes_positivos = volumes[mask]
+            
+            # Limites dos quartis, incluindo mínimo e máximo (como no pd.qcut)
+            limites = np.quantile(volumes_positivos, [0, 0.25, 0.5, 0.75, 1])
+            
+            if np.unique(limites).size < 5:
+                # Limites repetidos (o pd.qcut falharia): usar faixas de
+                # mesma largura, como no pd.cut com bins=4
+                minimo = volumes_positivos.min()
+                maximo = volumes_positivos.max()
+                if minimo == maximo:
+                    # Intervalo degenerado: o pd.cut amplia a faixa em 0,1%
+                    minimo -= 0.001 * abs(minimo)
+                    maximo += 0.001 * abs(maximo)
+                limites = np.linspace(minimo, maximo, 5)
+            
+            # Intervalos fechados à direita, como no pd.qcut/pd.cut
+            codigos[mask] = np.digitize(
+                volumes_positivos, limites[1:-1], right=True
+            ) + 1
+        
+        return pd.Series(
+            pd.Categorical.from_codes(codigos, dtype=TIPO_VOLUME),
+            index=serie_volume.index
+        )
+    
+    def executar_pipeline_unificado(self, ano_inicio: int, ano_fim: int) -> pd.DataFrame:
+        """
+        Executa pipeline completa para um período em um único DataFrame
+        
+        Os dados brutos de todos os anos são concatenados antes do
+        processamento, de modo que cada etapa roda uma única vez
+        
+        Args:
+            ano_inicio: Ano inicial do período
+            ano_fim: Ano final do período
             
-            # Usar quartis para categorização
-            try:
-                categorias = pd.qcut(
-                    volumes_positivos,
-                    q=4,
-                    labels=['Muito Baixo', 'Baixo', 'Médio', 'Alto']
-                )
-                volume_categorizado[mask] = categorias
-            except ValueError:
-                # Se não for possível usar quartis (poucos valores únicos)
-                # Usar categorização simples
-                bins = pd.cut(
-                    volumes_positivos,
-                    bins=4,
-                    labels=['Muito Baixo', 'Baixo', 'Médio', 'Alto']
-                )
-                volume_categorizado[mask] = bins
-        
-        return volume_categorizado
+        Returns:
+            DataFrame processado com todos os anos
+        """
+        # Baixar dados auxiliares antes dos downloads paralelos,
+        # para que as threads não disputem o preenchimento do cache
+        self.baixar_dados_cambio()
+        self.baixar_dados_continentes()
+        
+        anos = range(ano_inicio, ano_fim + 1)
+        dados_brutos_por_ano = {}
+        
+        # Baixar dados brutos em paralelo (etapa limitada por I/O de rede)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futuros = {
+                executor.submit(self.baixar_dados_exportacao_ano, ano): ano
+                for ano in anos
+            }
+            for futuro in as_completed(futuros):
+                ano = futuros[futuro]
+                print(f"Ano {ano} baixado")
+                dados_brutos_por_ano[ano] = futuro.result()
+        
+        print(f"Processando anos {ano_inicio} a {ano_fim}...")
+        
+        # Concatenar em ordem cronológica e processar de uma vez
+        dados_brutos = pd.concat(
+            [dados_brutos_por_ano[ano] for ano in anos],
+            ignore_index=True,
+            sort=False
+        )
+        
+        return self.processar_dados_exportacao(dados_brutos)
     
     def executar_pipeline(self, ano_inicio: int, ano_fim: int) -> Dict[str, pd.DataFrame]:
         """
@@ -279,21 +442,41 @@ class PipelineDadosVinho:
         Returns:
             Dicionário com DataFrames por ano
         """
-        dados_por_ano = {}
+        dados_unificados = self.executar_pipeline_unificado(ano_inicio, ano_fim)
         
-        for ano in range(ano_inicio, ano_fim + 1):
-            print(f"Processando ano {ano}...")
-            
-            # Baixar dados brutos
-            dados_brutos = self.baixar_dados_exportacao_ano(ano)
-            
-            # Processar dados
-            dados_processados = self.processar_dados_exportacao(dados_brutos)
+        return self.separar_por_ano(
+            dados_unificados,
+            anos=range(ano_inicio, ano_fim + 1)
+        )
+    
+    def separar_por_ano(
+        self,
+        dados_unificados: pd.DataFrame,
+        anos: Optional[Iterable[int]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Separa o DataFrame unificado em um DataFrame por ano
+        
+        Args:
+            dados_unificados: DataFrame com todos os anos
+            anos: Anos a incluir; anos sem dados viram DataFrames vazios
+                com as mesmas colunas. Se omitido, usa os anos presentes
             
-            # Armazenar
-            dados_por_ano[f'exp_{ano}'] = dados_processados
+        Returns:
+            Dicionário com DataFrames por ano
+        """
+        linhas_por_ano = dados_unificados.groupby('Ano', sort=True).indices
+        sem_linhas = np.array([], dtype=np.intp)
+        
+        if anos is None:
+            anos = linhas_por_ano
         
-        return dados_por_ano
+        return {
+            f'exp_{ano}': dados_unificados
+                .iloc[linhas_por_ano.get(ano, sem_linhas)]
+                .reset_index(drop=True)
+            for ano in anos
+        }
     
     def unificar_dados(self, dados_por_ano: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         """
@@ -305,12 +488,11 @@ class PipelineDadosVinho:
         Returns:
             DataFrame unificado
         """
-        todos_dados = []
-        
-        for ano, df in dados_por_ano.items():
-            todos_dados.append(df)
-        
-        return pd.concat(todos_dados, ignore_index=True)
+        return pd.concat(
+            list(dados_por_ano.values()),
+            ignore_index=True,
+            sort=False
+        )
     
     def obter_metadados(self, dados_por_ano: Dict[str, pd.DataFrame]) -> Dict:
         """
@@ -322,17 +504,31 @@ class PipelineDadosVinho:
         Returns:
             Dicionário com metadados
         """
-        primeiro_ano = list(dados_por_ano.keys())[0]
-        df_primeiro_ano = dados_por_ano[primeiro_ano]
+        anos_disponiveis = list(dados_por_ano)
+        df_primeiro_ano = dados_por_ano[anos_disponiveis[0]]
+        
+        # Separar colunas por tipo em uma única passada pelos dtypes
+        colunas_numericas = []
+        colunas_categoricas = []
+        for coluna, dtype in df_primeiro_ano.dtypes.items():
+            if pd.api.types.is_numeric_dtype(dtype):
+                colunas_numericas.append(coluna)
+            elif (
+                pd.api.types.is_object_dtype(dtype)
+                or pd.api.types.is_string_dtype(dtype)
+                or isinstance(dtype, pd.CategoricalDtype)
+            ):
+                colunas_categoricas.append(coluna)
         
         metadados = {
-            'total_paises': len(df_primeiro_ano['Países'].unique()),
+            # Em colunas categóricas o nunique opera sobre os códigos
+            'total_paises': df_primeiro_ano['Países'].nunique(),
             'colunas': list(df_primeiro_ano.columns),
             'total_anos': len(dados_por_ano),
-            'anos_disponiveis': list(dados_por_ano.keys()),
+            'anos_disponiveis': anos_disponiveis,
             'estrutura_dados': {
-                'colunas_numericas': df_primeiro_ano.select_dtypes(include=[np.number]).columns.tolist(),
-                'colunas_categoricas': df_primeiro_ano.select_dtypes(include=['object']).columns.tolist(),
+                'colunas_numericas': colunas_numericas,
+                'colunas_categoricas': colunas_categoricas,
             }
         }
         
@@ -340,7 +536,7 @@ class PipelineDadosVinho:
 
     def salvar_dados_separados(self, dados_por_ano: Dict[str, pd.DataFrame]):
         """
-        Salva os DataFrames em CSV
+        Salva os DataFrames em Parquet
         
         Args:
             dados_por_ano: Dicionário com DataFrames por ano
@@ -349,13 +545,35 @@ class PipelineDadosVinho:
             Dicionário com metadados
         """
         for nome, tabela in dados_por_ano.items():
-            tabela.to_csv(f'Data/Embrapa_vitibrasil_{nome}.csv', encoding='UTF-8', index=False)
+            tabela.to_parquet(f'Data/Embrapa_vitibrasil_{nome}.parquet', **PARQUET_OPCOES)
 
         return f'dados salvos'
 
+    def salvar_dados_particionados(self, dados_unificados: pd.DataFrame) -> str:
+        """
+        Salva os dados em um dataset Parquet particionado por ano
+        
+        O PyArrow grava um arquivo por ano (Data/vitibrasil/Ano=<ano>/)
+        a partir do DataFrame unificado, em uma única escrita
+        
+        Args:
+            dados_unificados: DataFrame com todos os anos
+            
+        Returns:
+            String
+        """
+        dados_unificados.to_parquet(
+            'Data/vitibrasil',
+            partition_cols=['Ano'],
+            existing_data_behavior='delete_matching',
+            **PARQUET_OPCOES
+        )
+
+        return 'dados salvos'
+
     def salvar_dados_unificados(self, dados_unificados: pd.DataFrame) -> str:
         """
-        Salva os DataFrames em CSV
+        Salva os DataFrames em Parquet
         
         Args:
             dados_unificados: DataFrame
@@ -363,6 +581,6 @@ class PipelineDadosVinho:
         Returns:
             String
         """
-        dados_unificados.to_csv('Data/Empraba_vitibrasil_exp.csv', encoding='UTF-8', index=False)
+        dados_unificados.to_parquet('Data/Empraba_vitibrasil_exp.parquet', **PARQUET_OPCOES)
         return f'dados salvos'
 
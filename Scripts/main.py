@@ -1,14 +1,19 @@
 from dados import PipelineDadosVinho
 from pprint import pprint
 
+ano_inicio, ano_fim = 2009, 2024
+
 pipeline = PipelineDadosVinho(densidade_vm=0.995)
-dados_por_ano = pipeline.executar_pipeline(2009, 2024)
-dados_unificados = pipeline.unificar_dados(dados_por_ano)
+dados_unificados = pipeline.executar_pipeline_unificado(ano_inicio, ano_fim)
+dados_por_ano = pipeline.separar_por_ano(
+    dados_unificados,
+    anos=range(ano_inicio, ano_fim + 1)
+)
 print(dados_unificados)
 metadados = pipeline.obter_metadados(dados_por_ano)
 pprint(metadados)
 print(dados_unificados)
 
 
-pipeline.salvar_dados_separados(dados_por_ano)
+pipeline.salvar_dados_particionados(dados_unificados)
 pipeline.salvar_dados_unificados(dados_unificados)
\ No newline at end of file